@@ -0,0 +1,70 @@
+# cython: language_level=3
+"""
+Compiled versions of `dict_to_container` and `dict_to_asset`.
+
+This extension is optional. `thot.resources` uses these implementations
+when the extension has been built and falls back to its pure-Python
+implementations otherwise. Build in place with
+
+    cythonize -i src/thot/_resources_fast.pyx
+"""
+from .resources import Container, Asset
+
+def dict_to_container(dict d, db = None):
+    """
+    Converts a dictionary to a Container.
+
+    Args:
+        d (dict[str, Any]): Dictionary to convert.
+
+    Returns:
+        Container: Container that the JSON represented.
+    """
+    cdef dict p = d["properties"]
+    container = Container.__new__(Container)
+    container._rid = d["rid"]
+    container._name = p["name"]
+    container._type = p["kind"]
+    container._description = p["description"]
+    container._tags = p["tags"]
+    container._metadata = p["metadata"]
+    container._db = db
+    container._parent = None
+    container._parent_set = False
+    container._assets_fetched = False
+    container._children = []
+    container._children_fetched = False
+
+    assets = [dict_to_asset(asset, db = db, parent = container) for asset in d["assets"].values()]
+    container._assets = assets
+    container._assets_by_rid = {asset._rid: asset for asset in assets}
+
+    return container
+
+def dict_to_asset(dict d, db = None, parent = None):
+    """
+    Converts a dictionary to an Asset.
+
+    Args:
+        d (dict[str, Any]): Dictionary to convert.
+
+    Returns:
+        Asset: Asset that the JSON represented.
+    """
+    cdef dict file = d["path"]
+    if "Absolute" not in file:
+        raise ValueError("Asset path must be absolute")
+
+    cdef dict p = d["properties"]
+    asset = Asset.__new__(Asset)
+    asset._rid = d["rid"]
+    asset._file = file["Absolute"]
+    asset._name = p["name"]
+    asset._type = p["kind"]
+    asset._description = p["description"]
+    asset._tags = p["tags"]
+    asset._metadata = p["metadata"]
+    asset._db = db
+    asset._parent = parent
+
+    return asset
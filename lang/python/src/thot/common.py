@@ -1,10 +1,56 @@
 import os
 
+try:
+    import orjson
+
+    def json_dumps(obj) -> bytes:
+        """
+        Serializes an object to JSON.
+
+        Returns:
+            bytes: Encoded JSON.
+        """
+        return orjson.dumps(obj)
+
+    def json_loads(data):
+        """
+        Deserializes JSON.
+
+        Returns:
+            The decoded object.
+        """
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def json_dumps(obj) -> bytes:
+        """
+        Serializes an object to JSON.
+
+        Returns:
+            bytes: Encoded JSON.
+        """
+        return json.dumps(obj).encode()
+
+    def json_loads(data):
+        """
+        Deserializes JSON.
+
+        Returns:
+            The decoded object.
+        """
+        return json.loads(data)
+
+_DEV_MODE: bool = os.getenv("THOT_CONTAINER_ID") is None
+
 def dev_mode() -> bool:
     """
     Returns if the script is running in dev mode.
-    
+    Computed once at import; the environment variable
+    does not change within a process.
+
     Returns:
         bool: If the database is running in dev mode.
     """
-    return os.getenv("THOT_CONTAINER_ID") is None
\ No newline at end of file
+    return _DEV_MODE
\ No newline at end of file
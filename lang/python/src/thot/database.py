@@ -11,7 +11,9 @@ import zmq
 
 from thot import _LEGACY_
 from .types import OptStr, Tags, Metadata
+from .pipeline import PipelinedClient
 from .resources import Container, Asset, dict_to_container, dict_to_asset
+from .subtree import SubtreeView
 
 OptTags = Union[Tags, None]
 OptMetadata = Union[Metadata, None]
@@ -44,10 +46,11 @@ class Database:
             chdir (bool, optional): Whether to change the directory to the script's. Defaults to `True`.
         """
         self._ctx: zmq.Context = zmq.Context()
-        self._socket: zmq.Socket = self._ctx.socket(zmq.REQ)
-        self._socket.setsockopt(zmq.SNDTIMEO, SOCKET_TIMEOUT)
-        self._socket.setsockopt(zmq.RCVTIMEO, SOCKET_TIMEOUT)
-        self._socket.connect(f'tcp://{LOCALHOST}:{THOT_PORT}')
+        self._pipeline: PipelinedClient = PipelinedClient(
+            self._ctx,
+            f'tcp://{LOCALHOST}:{THOT_PORT}'
+        )
+        self._init_request_templates()
         if not self._is_database_available():
             exe_base_name = "thot-local-database"
             os_name = platform.system()
@@ -79,34 +82,29 @@ class Database:
             
             self._root_path: str = dev_root
         else:
-            self._socket.send_json({"ContainerCommand": {"Path": root_id}})
-            root_path = self._socket.recv_json()
+            root_path = self._request({"ContainerCommand": {"Path": root_id}})
             self._root_path: str = root_path
-            
-        self._socket.send_json({"ProjectCommand": {"ResourceRootPath": self._root_path}})
-        project_path = self._socket.recv_json()
+
+        project_path = self._request({"ProjectCommand": {"ResourceRootPath": self._root_path}})
         if "Ok" not in project_path:
             raise RuntimeError("could not get project path")
-        
+
         project_path = project_path["Ok"]
-        self._socket.send_json({"ProjectCommand": {"Load": project_path}})
-        project = self._socket.recv_json()
+        project = self._request({"ProjectCommand": {"Load": project_path}})
         if "Ok" not in project:
             raise RuntimeError(f"could not load project")
-        
+
         project = project["Ok"]
-        self._socket.send_json({"GraphCommand": {"Load": project["rid"]}})
-        graph = self._socket.recv_json()
+        graph = self._request({"GraphCommand": {"Load": project["rid"]}})
         if "Ok" not in graph:
             raise RuntimeError("could not load graph")
-        
-        self._socket.send_json({"ContainerCommand": {"ByPath": self._root_path}})
-        root = self._socket.recv_json()
+
+        root = self._request({"ContainerCommand": {"ByPath": self._root_path}})
         if root is None:
             raise RuntimeError("could not get root Container")
-        
+
         self._root: str = root["rid"]
-        
+
         if chdir:
             analysis_root = project["analysis_root"]
             if analysis_root is None:
@@ -115,6 +113,56 @@ class Database:
             analysis_path = os.path.join(project_path, analysis_root)
             os.chdir(analysis_path)
         
+    def _init_request_templates(self):
+        """
+        Pre-builds request dictionaries for the hot accessors so each
+        request only stores the variable id instead of allocating the
+        nested dicts again.
+
+        Templates belong to a single Database instance;
+        threads should use `clone` to get their own.
+        """
+        self._req_container_with_metadata = {"GetWithMetadata": None}
+        self._msg_container_with_metadata = {"ContainerCommand": self._req_container_with_metadata}
+        self._req_children_with_metadata = {"ChildrenWithMetadata": None}
+        self._msg_children_with_metadata = {"GraphCommand": self._req_children_with_metadata}
+        self._req_graph_parent = {"Parent": None}
+        self._msg_graph_parent = {"GraphCommand": self._req_graph_parent}
+        self._req_asset_parent = {"Parent": None}
+        self._msg_asset_parent = {"AssetCommand": self._req_asset_parent}
+
+    def _container_with_metadata_msg(self, rid: str):
+        """
+        Returns:
+            The `ContainerCommand::GetWithMetadata` request for the given id.
+        """
+        self._req_container_with_metadata["GetWithMetadata"] = rid
+        return self._msg_container_with_metadata
+
+    def _children_with_metadata_msg(self, rid: str):
+        """
+        Returns:
+            The `GraphCommand::ChildrenWithMetadata` request for the given id.
+        """
+        self._req_children_with_metadata["ChildrenWithMetadata"] = rid
+        return self._msg_children_with_metadata
+
+    def _graph_parent_msg(self, rid: str):
+        """
+        Returns:
+            The `GraphCommand::Parent` request for the given id.
+        """
+        self._req_graph_parent["Parent"] = rid
+        return self._msg_graph_parent
+
+    def _asset_parent_msg(self, rid: str):
+        """
+        Returns:
+            The `AssetCommand::Parent` request for the given id.
+        """
+        self._req_asset_parent["Parent"] = rid
+        return self._msg_asset_parent
+
     def _is_database_available(self) -> bool:
         """
         Check if a database is already running.
@@ -144,8 +192,7 @@ class Database:
             # socket not bound, no chance of database running
             return False
             
-        self._socket.send_json({'DatabaseCommand': 'Id'})
-        resp = self._socket.recv_json()
+        resp = self._request({'DatabaseCommand': 'Id'})
         return resp == "thot local database"
         
     @property
@@ -156,8 +203,7 @@ class Database:
         Returns:
             Container: Root Container.
         """
-        self._socket.send_json({"ContainerCommand": {"GetWithMetadata": self._root}})
-        root = self._socket.recv_json()
+        root = self._request(self._container_with_metadata_msg(self._root))
         if root is None:
             raise RuntimeError("Could not get root Container")
 
@@ -168,6 +214,59 @@ class Database:
         root._db = self
         return root
                 
+    def prefetch_subtree(self, root: str) -> Container:
+        """
+        Fetches an entire subtree in a single request.
+
+        Containers in the subtree have their Assets and parent populated,
+        so traversing the subtree does not require any additional requests.
+
+        Args:
+            root (str): Id of the subtree's root Container.
+
+        Returns:
+            Container: Root Container of the subtree.
+        """
+        subtree = self._request({"GraphCommand": {"SubtreeWithMetadata": root}})
+        if subtree is None:
+            raise RuntimeError("Could not get subtree")
+
+        containers = {}
+        for container in subtree["containers"]:
+            container = dict_to_container(container, db = self)
+            container._assets_fetched = True
+            containers[container._rid] = container
+
+        for child, parent in subtree["parents"].items():
+            container = containers[child]
+            container._set_parent(containers[parent] if parent is not None else None)
+            if parent is not None:
+                containers[parent]._children.append(container)
+
+        for container in containers.values():
+            container._children_fetched = True
+
+        return containers[root]
+
+    def snapshot_subtree(self, root: str) -> SubtreeView:
+        """
+        Fetches an entire subtree in a single request and decodes it into
+        a column-oriented `SubtreeView` instead of one object per node.
+        Suited to analytics that scan a few fields over large trees;
+        use `prefetch_subtree` when working with Container objects.
+
+        Args:
+            root (str): Id of the subtree's root Container.
+
+        Returns:
+            SubtreeView: Snapshot of the subtree.
+        """
+        subtree = self._request({"GraphCommand": {"SubtreeWithMetadata": root}})
+        if subtree is None:
+            raise RuntimeError("Could not get subtree")
+
+        return SubtreeView.from_subtree(subtree, db = self)
+
     def find_containers(
         self,
         name: OptStr = None,
@@ -197,15 +296,11 @@ class Database:
         if metadata is not None:
             f['metadata'] = metadata
         
-        self._socket.send_json({"ContainerCommand": {"FindWithMetadata": (self._root, f)}})
-        containers = self._socket.recv_json()
+        containers = self._request({"ContainerCommand": {"FindWithMetadata": (self._root, f)}})
         if 'Err' in containers:
             raise RuntimeError(f"Error getting containers: {containers['Err']}")
 
-        return list(map(
-            lambda container: dict_to_container(container, db = self),
-            containers
-        ))
+        return [dict_to_container(container, db = self) for container in containers]
                 
     def find_container(
         self,
@@ -261,15 +356,11 @@ class Database:
         if metadata is not None:
             f['metadata'] = metadata
         
-        self._socket.send_json({"AssetCommand": {"FindWithMetadata": (self._root, f)}})
-        assets = self._socket.recv_json()
+        assets = self._request({"AssetCommand": {"FindWithMetadata": (self._root, f)}})
         if 'Err' in assets:
             raise RuntimeError(f"Error getting assets: {assets['Err']}")
 
-        return list(map(
-            lambda asset: dict_to_asset(asset, db = self),
-            assets
-        ))
+        return [dict_to_asset(asset, db = self) for asset in assets]
             
     def find_asset(
         self,
@@ -302,8 +393,8 @@ class Database:
         name: OptStr = None,
         type: OptStr = None,
         description: OptStr = None,
-        tags: Tags = [],
-        metadata: Metadata = {}    
+        tags: OptTags = None,
+        metadata: OptMetadata = None
     ) -> str:
         """
         Adds an Asset to the project.
@@ -320,7 +411,12 @@ class Database:
         """
         if os.path.isabs(file):
             raise ValueError("file must be relative")
-        
+
+        if tags is None:
+            tags = []
+        if metadata is None:
+            metadata = {}
+
         path = {"Relative": file}
         user = self._active_user()
         if user is None:
@@ -343,8 +439,7 @@ class Database:
             'path': path
         }
         
-        self._socket.send_json({"AssetCommand": {"Add": (asset, self._root)}})
-        res = self._socket.recv_json()
+        res = self._request({"AssetCommand": {"Add": (asset, self._root)}})
         if "Ok" not in res:
             raise RuntimeError(f"could not create Asset: {res['Err']}")
         
@@ -359,27 +454,48 @@ class Database:
             resource (Union[Container, Asset]): Resource to flag.
             message (str): Message to display.
         """
-        self._socket.send_json({"AnalysisCommand": {"Flag": {"resource": resource._rid, "message": message}}})
-        res = self._socket.recv_json()
+        res = self._request({"AnalysisCommand": {"Flag": {"resource": resource._rid, "message": message}}})
     
     def clone(self) -> 'Database':
         """Clones the Database.
-        For use in multithreaded applications.
+        Requests from all clones share a single pipelined connection,
+        which is safe to use from multiple threads.
 
         Returns:
             Database: Clone of the Database.
         """
         clone = Database.__new__(Database)
         clone._ctx = self._ctx
-        clone._socket: zmq.Socket = self._ctx.socket(zmq.REQ)
         clone._root_path = self._root_path
         clone._root = self._root
-        
-        clone._socket.setsockopt(zmq.SNDTIMEO, SOCKET_TIMEOUT)
-        clone._socket.setsockopt(zmq.RCVTIMEO, SOCKET_TIMEOUT)
-        clone._socket.connect(f'tcp://{LOCALHOST}:{THOT_PORT}')
+        clone._pipeline = self._pipeline
+        clone._init_request_templates()
         return clone
-    
+
+    def _submit(self, msg):
+        """
+        Submit a request to the database without waiting for its response.
+
+        Args:
+            msg: Request to send.
+
+        Returns:
+            Future: Future resolved with the response.
+        """
+        return self._pipeline.submit(msg)
+
+    def _request(self, msg):
+        """
+        Submit a request to the database and wait for its response.
+
+        Args:
+            msg: Request to send.
+
+        Returns:
+            The decoded response.
+        """
+        return self._pipeline.submit(msg).result(SOCKET_TIMEOUT / 1000)
+
     def _active_user(self) -> OptStr:
         """
         Get the active user.
@@ -387,8 +503,7 @@ class Database:
         Returns:
             OptStr: Active user.
         """
-        self._socket.send_json({"UserCommand": "GetActive"})
-        user = self._socket.recv_json()
+        user = self._request({"UserCommand": "GetActive"})
         if "Ok" not in user:
             return None
         
@@ -0,0 +1,118 @@
+import itertools
+import threading
+from concurrent.futures import Future
+
+import zmq
+
+from .common import json_dumps, json_loads
+
+class PipelinedClient:
+    """
+    Issues multiple in-flight database requests over a single socket.
+
+    Requests are submitted with `submit`, which returns a
+    `concurrent.futures.Future` resolved by a background reader thread.
+    ZMQ sockets are not thread safe, so the reader thread has exclusive
+    ownership of the DEALER socket; `submit` hands requests to it over
+    an inproc PAIR socket registered in the same poller.
+
+    Each request carries a correlation id frame that the database's REP
+    socket echoes back as part of the envelope, so a response always
+    resolves the future of the request it answers, even if an in-flight
+    reply is lost.
+    """
+    def __init__(self, ctx: zmq.Context, address: str):
+        """
+        Create a new PipelinedClient.
+
+        Args:
+            ctx (zmq.Context): Context to create the sockets from.
+            address (str): Address of the database.
+        """
+        self._socket: zmq.Socket = ctx.socket(zmq.DEALER)
+        self._socket.connect(address)
+
+        # inproc requires bind before connect
+        relay = f"inproc://pipeline-requests-{id(self):x}"
+        self._requests_in: zmq.Socket = ctx.socket(zmq.PAIR)
+        self._requests_in.bind(relay)
+        self._requests_out: zmq.Socket = ctx.socket(zmq.PAIR)
+        self._requests_out.connect(relay)
+
+        self._pending: dict = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._correlation = itertools.count()
+
+        self._poller: zmq.Poller = zmq.Poller()
+        self._poller.register(self._socket, zmq.POLLIN)
+        self._poller.register(self._requests_in, zmq.POLLIN)
+
+        self._stop: bool = False
+        self._reader: threading.Thread = threading.Thread(
+            target = self._read_responses,
+            daemon = True
+        )
+        self._reader.start()
+
+    def submit(self, msg) -> Future:
+        """
+        Submit a request without waiting for its response.
+
+        Args:
+            msg: Request to send.
+
+        Returns:
+            Future: Future resolved with the decoded response.
+        """
+        # serialize before touching shared state so an unserializable
+        # message leaves no orphaned future behind
+        data = json_dumps(msg)
+
+        future = Future()
+        with self._lock:
+            correlation = b"%d" % next(self._correlation)
+            self._pending[correlation] = future
+            self._requests_out.send_multipart([correlation, b"", data])
+
+        return future
+
+    def close(self):
+        """
+        Stop the reader thread and close the sockets.
+        Pending requests are cancelled.
+        """
+        self._stop = True
+        self._reader.join()
+        self._socket.close()
+        self._requests_in.close()
+        self._requests_out.close()
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+
+            self._pending.clear()
+
+    def _read_responses(self):
+        """
+        Forward submitted requests to the database and resolve pending
+        futures with its responses. Runs on the reader thread, which is
+        the only thread that touches the DEALER socket.
+        """
+        while not self._stop:
+            events = dict(self._poller.poll(100))
+            if self._requests_in in events:
+                self._socket.send_multipart(self._requests_in.recv_multipart())
+
+            if self._socket in events:
+                frames = self._socket.recv_multipart()
+                with self._lock:
+                    future = self._pending.pop(frames[0], None)
+
+                # replies we no longer track are dropped
+                if future is None:
+                    continue
+
+                try:
+                    future.set_result(json_loads(frames[-1]))
+                except Exception as err:
+                    future.set_exception(err)
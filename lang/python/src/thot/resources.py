@@ -1,4 +1,5 @@
-from typing import Union
+from operator import attrgetter
+from typing import Iterator, Union
 
 from thot import _LEGACY_
 from .types import OptStr, Tags, Metadata, Properties
@@ -6,27 +7,50 @@ from .common import dev_mode
 
 OptDatabase = Union['Database', None]
 OptContainer = Union['Container', None]
+OptTags = Union[Tags, None]
+OptMetadata = Union[Metadata, None]
 if _LEGACY_:
-    from typing import List
+    from typing import Dict, List
     Assets = List['Asset']
+    AssetMap = Dict[str, 'Asset']
     ContainerList = List['Container']
 else:
     Assets = list['Asset']
+    AssetMap = dict[str, 'Asset']
     ContainerList = list['Container']
-    
+
+OptAssets = Union[Assets, None]
+
 class Container:
     """
     A Container.
     """
+    __slots__ = (
+        "_rid",
+        "_name",
+        "_type",
+        "_description",
+        "_tags",
+        "_metadata",
+        "_assets",
+        "_assets_by_rid",
+        "_assets_fetched",
+        "_children",
+        "_children_fetched",
+        "_db",
+        "_parent",
+        "_parent_set",
+    )
+
     def __init__(
         self,
         rid: str,
         name: OptStr = None,
         type: OptStr = None,
         description: OptStr = None,
-        tags: Tags = [],
-        metadata: Metadata = {},
-        assets: Assets = [],
+        tags: OptTags = None,
+        metadata: OptMetadata = None,
+        assets: OptAssets = None,
         db: OptDatabase = None
     ):
         """
@@ -36,54 +60,26 @@ class Container:
         self._name: OptStr = name
         self._type: OptStr = type
         self._description: OptStr = description
-        self._tags: Tags = tags
-        self._metadata: Metadata = metadata
-        self._assets: Assets = assets
-        
+        self._tags: Tags = [] if tags is None else tags
+        self._metadata: Metadata = {} if metadata is None else metadata
+        self._assets: Assets = [] if assets is None else assets
+        self._assets_by_rid: AssetMap = {asset._rid: asset for asset in self._assets}
+
         self._db: OptDatabase = db
         self._parent: OptContainer = None
         self._parent_set: bool = False
-    
-    @property
-    def name(self) -> OptStr:
-        """
-        Returns:
-            OptStr: Container's name.
-        """
-        return self._name
-    
-    @property
-    def type(self) -> OptStr:
-        """
-        Returns:
-            OptStr: Container's type.
-        """
-        return self._type
-    
-    @property
-    def description(self) -> OptStr:
-        """
-        Returns:
-            OptStr: Container's description.
-        """
-        return self._description
-    
-    @property
-    def tags(self) -> Tags:
-        """
-        Returns:
-            Tags: Container's tags.
-        """
-        return self._tags
-    
-    @property
-    def metadata(self) -> Metadata:
-        """
-        Returns:
-            Metadata: Container's metadata.
-        """
-        return self._metadata
-        
+        self._assets_fetched: bool = False
+        self._children: ContainerList = []
+        self._children_fetched: bool = False
+
+    # simple read-only accessors;
+    # attrgetter reads the slot without a Python frame per access
+    name = property(attrgetter("_name"), doc = "OptStr: Container's name.")
+    type = property(attrgetter("_type"), doc = "OptStr: Container's type.")
+    description = property(attrgetter("_description"), doc = "OptStr: Container's description.")
+    tags = property(attrgetter("_tags"), doc = "Tags: Container's tags.")
+    metadata = property(attrgetter("_metadata"), doc = "Metadata: Container's metadata.")
+
     @property
     def assets(self) -> Assets:
         """
@@ -92,41 +88,65 @@ class Container:
         """
         if self._db is None or not dev_mode():
             return self._assets
-        
-        self._db._socket.send_json({"ContainerCommand": {"GetWithMetadata": self._rid}})
-        container = self._db._socket.recv_json()
+
+        if self._assets_fetched:
+            return self._assets
+
+        container = self._db._request(self._db._container_with_metadata_msg(self._rid))
         if container is None:
             raise RuntimeError("Could not retrieve Container")
-        
-        container = dict_to_container(container, db = self._db)
-        self._assets = container._assets
+
+        # the response carries the full node, refresh its properties too
+        p = container["properties"]
+        self._name = p["name"]
+        self._type = p["kind"]
+        self._description = p["description"]
+        self._tags = p["tags"]
+        self._metadata = p["metadata"]
+
+        self._merge_assets(container["assets"].values())
+        self._assets_fetched = True
         return self._assets
     
-    def children(self) -> ContainerList:
+    def children_iter(self) -> Iterator['Container']:
         """
+        Iterates over the Container's children,
+        materializing each child only as it is consumed.
+        Callers that stop early skip building the remaining children.
+
+        Children cached by `prefetch_subtree` or a previous full
+        iteration are reused without a request;
+        `refresh` clears the cache.
+
         Returns:
-            ContainerList: Container's children.
+            Iterator[Container]: Container's children.
         """
-        self._db._socket.send_json({"GraphCommand": {"Children": self._rid}})
-        child_ids = self._db._socket.recv_json()
-        children = []
-        for cid in child_ids:
-            self._db._socket.send_json({"ContainerCommand": {"GetWithMetadata": cid}})
-            child = self._db._socket.recv_json()
-            if child is None:
-                raise RuntimeError("Could not get child Container")
-            
-            children.append(child)
-            
-        children = list(map(
-            lambda child: dict_to_container(child, db = self._db),
-            children
-        ))
-        
+        if self._children_fetched:
+            yield from self._children
+            return
+
+        children = self._db._request(self._db._children_with_metadata_msg(self._rid))
+        if children is None:
+            raise RuntimeError("Could not get child Containers")
+
+        fetched = []
         for child in children:
+            child = dict_to_container(child, db = self._db)
             child._set_parent(self)
-        
-        return children
+            # the payload carries each child's full asset list
+            child._assets_fetched = True
+            fetched.append(child)
+            yield child
+
+        self._children = fetched
+        self._children_fetched = True
+
+    def children(self) -> ContainerList:
+        """
+        Returns:
+            ContainerList: Container's children.
+        """
+        return list(self.children_iter())
     
     def parent(self) -> OptContainer:
         """
@@ -134,24 +154,22 @@ class Container:
             OptContainer: Container's parent or `None` if the
             Container is the root of the current graph.
         """
+        if self._parent_set:
+            return self._parent
+
         if self._db is None:
             raise RuntimeError('No database connector')
-        
-        if self._parent_set and not dev_mode():
-            return self._parent
-        
+
         if self._rid == self._db._root:
             self._set_parent(None)
             return None
             
-        self._db._socket.send_json({"GraphCommand": {"Parent": self._rid}})
-        parent = self._db._socket.recv_json()
+        parent = self._db._request(self._db._graph_parent_msg(self._rid))
         if parent is None:
             self._set_parent(None)
             return None
-        
-        self._db._socket.send_json({"ContainerCommand": {"GetWithMetadata": parent}})
-        parent = self._db._socket.recv_json()
+
+        parent = self._db._request(self._db._container_with_metadata_msg(parent))
         if parent is None:
             raise RuntimeError("Could not get container parent")
         
@@ -159,6 +177,52 @@ class Container:
         self._set_parent(parent)
         return parent
     
+    def _merge_assets(self, assets):
+        """Merge fetched Asset dictionaries into the current Assets,
+        reusing existing Asset objects by id.
+
+        Assets the Container already holds are updated in place,
+        so references callers hold to them stay valid.
+
+        Args:
+            assets: Fetched Asset dictionaries.
+        """
+        merged = []
+        by_rid = {}
+        for d in assets:
+            asset = self._assets_by_rid.get(d["rid"])
+            if asset is None:
+                asset = dict_to_asset(d, db = self._db, parent = self)
+            else:
+                file = d["path"]
+                if "Absolute" not in file:
+                    raise ValueError("Asset path must be absolute")
+
+                p = d["properties"]
+                asset._file = file["Absolute"]
+                asset._name = p["name"]
+                asset._type = p["kind"]
+                asset._description = p["description"]
+                asset._tags = p["tags"]
+                asset._metadata = p["metadata"]
+
+            by_rid[asset._rid] = asset
+            merged.append(asset)
+
+        self._assets = merged
+        self._assets_by_rid = by_rid
+
+    def refresh(self):
+        """
+        Clears cached state so the next access of `assets`, `children`,
+        or `parent` fetches fresh data from the database.
+        """
+        self._assets_fetched = False
+        self._children = []
+        self._children_fetched = False
+        self._parent = None
+        self._parent_set = False
+
     def _set_parent(self, parent: OptContainer):
         """Set the Container's parent
 
@@ -173,6 +237,18 @@ class Asset:
     """
     An Asset.
     """
+    __slots__ = (
+        "_rid",
+        "_file",
+        "_name",
+        "_type",
+        "_description",
+        "_tags",
+        "_metadata",
+        "_db",
+        "_parent",
+    )
+
     def __init__(
         self,
         rid: str,
@@ -180,8 +256,8 @@ class Asset:
         name: OptStr = None,
         description: OptStr = None,
         type: OptStr = None,
-        tags: Tags = [],
-        metadata: Metadata = {},
+        tags: OptTags = None,
+        metadata: OptMetadata = None,
         db: OptDatabase = None,
         parent: OptContainer = None,
     ):
@@ -193,59 +269,20 @@ class Asset:
         self._name: OptStr = name
         self._type: OptStr = type
         self._description: OptStr = description
-        self._tags: Tags = tags
-        self._metadata: Metadata = metadata
+        self._tags: Tags = [] if tags is None else tags
+        self._metadata: Metadata = {} if metadata is None else metadata
         self._db = db
         self._parent = parent
     
-    @property
-    def name(self) -> OptStr:
-        """
-        Returns:
-            OptStr: Asset's name.
-        """
-        return self._name
-            
-    @property
-    def type(self) -> OptStr:
-        """
-        Returns:
-            OptStr: Asset's type.
-        """
-        return self._type
-    
-    @property
-    def description(self) -> OptStr:
-        """
-        Returns:
-            OptStr: Asset's description.
-        """
-        return self._description
-    
-    @property
-    def tags(self) -> Tags:
-        """
-        Returns:
-            Tags: Asset's tags.
-        """
-        return self._tags
-    
-    @property
-    def metadata(self) -> Metadata:
-        """
-        Returns:
-            Metadata: Asset's metadata.
-        """
-        return self._metadata
-        
-    @property
-    def file(self) -> str:
-        """
-        Returns:
-            str: Asset's file path.
-        """
-        return self._file
-    
+    # simple read-only accessors;
+    # attrgetter reads the slot without a Python frame per access
+    name = property(attrgetter("_name"), doc = "OptStr: Asset's name.")
+    type = property(attrgetter("_type"), doc = "OptStr: Asset's type.")
+    description = property(attrgetter("_description"), doc = "OptStr: Asset's description.")
+    tags = property(attrgetter("_tags"), doc = "Tags: Asset's tags.")
+    metadata = property(attrgetter("_metadata"), doc = "Metadata: Asset's metadata.")
+    file = property(attrgetter("_file"), doc = "str: Asset's file path.")
+
     def parent(self) -> 'Container':
         """
         Returns:
@@ -257,17 +294,15 @@ class Asset:
         if self._db is None:
             raise RuntimeError("No database connector")
         
-        self._db._socket.send_json({"AssetCommand": {"Parent": self._rid}})
-        parent = self._db._socket.recv_json()
+        parent = self._db._request(self._db._asset_parent_msg(self._rid))
         if parent is None:
             return None
-        
-        self._db._socket.send_json({"ContainerCommand": {"GetWithMetadata": parent["rid"]}})
-        parent = self._db._socket.recv_json()
+
+        parent = self._db._request(self._db._container_with_metadata_msg(parent["rid"]))
         if parent is None:
             raise RuntimeError("Parent Container could not be retrieved")
         
-        return dict_to_container(parent, db = self._db)            
+        return dict_to_container(parent, db = self._db)
 
 def dict_to_container(d: Properties, db: OptDatabase = None) -> Container:
     """
@@ -279,21 +314,25 @@ def dict_to_container(d: Properties, db: OptDatabase = None) -> Container:
     Returns:
         Container: Container that the JSON represented.
     """
-    container =  Container(
-        d["rid"],
-        name = d["properties"]["name"],
-        type = d["properties"]["kind"],
-        description = d["properties"]["description"],
-        tags = d["properties"]["tags"],
-        metadata = d["properties"]["metadata"],
-        db = db
-    )
-    
-    container._assets = list(map(
-        lambda asset: dict_to_asset(asset, db = db, parent = container),
-        d["assets"].values()
-    ))
-    
+    p = d["properties"]
+    container = Container.__new__(Container)
+    container._rid = d["rid"]
+    container._name = p["name"]
+    container._type = p["kind"]
+    container._description = p["description"]
+    container._tags = p["tags"]
+    container._metadata = p["metadata"]
+    container._db = db
+    container._parent = None
+    container._parent_set = False
+    container._assets_fetched = False
+    container._children = []
+    container._children_fetched = False
+
+    assets = [dict_to_asset(asset, db = db, parent = container) for asset in d["assets"].values()]
+    container._assets = assets
+    container._assets_by_rid = {asset._rid: asset for asset in assets}
+
     return container
 
 def dict_to_asset(d: Properties, db: OptDatabase = None, parent: OptContainer = None) -> Asset:
@@ -309,15 +348,23 @@ def dict_to_asset(d: Properties, db: OptDatabase = None, parent: OptContainer =
     file = d["path"]
     if "Absolute" not in file:
         raise ValueError("Asset path must be absolute")
-    
-    return Asset(
-        d["rid"],
-        file["Absolute"],
-        name = d["properties"]["name"],
-        type = d["properties"]["kind"],
-        description = d["properties"]["description"],
-        tags = d["properties"]["tags"],
-        metadata = d["properties"]["metadata"],
-        db = db,
-        parent = parent
-    )
\ No newline at end of file
+
+    p = d["properties"]
+    asset = Asset.__new__(Asset)
+    asset._rid = d["rid"]
+    asset._file = file["Absolute"]
+    asset._name = p["name"]
+    asset._type = p["kind"]
+    asset._description = p["description"]
+    asset._tags = p["tags"]
+    asset._metadata = p["metadata"]
+    asset._db = db
+    asset._parent = parent
+
+    return asset
+
+try:
+    # Compiled versions of the factories; see `_resources_fast.pyx`.
+    from ._resources_fast import dict_to_container, dict_to_asset
+except ImportError:
+    pass
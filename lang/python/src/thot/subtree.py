@@ -0,0 +1,195 @@
+from thot import _LEGACY_
+from .types import Properties
+from .resources import Asset, Container
+
+if _LEGACY_:
+    from typing import Dict, List
+    IndexMap = Dict[str, int]
+    IntList = List[int]
+else:
+    IndexMap = dict[str, int]
+    IntList = list[int]
+
+class SubtreeView:
+    """
+    Column-oriented snapshot of a subtree.
+
+    Container fields are stored in parallel lists indexed by node, and
+    Asset fields are flattened into parallel lists sliced per node via
+    `asset_offsets`. Scanning a single field touches one list instead of
+    one object per node, which is much cheaper for analytics over large
+    trees. `container_at` materializes a regular Container on demand.
+    """
+    __slots__ = (
+        "rids",
+        "names",
+        "types",
+        "descriptions",
+        "tags",
+        "metadata",
+        "parent_index",
+        "asset_offsets",
+        "asset_rids",
+        "asset_files",
+        "asset_names",
+        "asset_types",
+        "asset_descriptions",
+        "asset_tags",
+        "asset_metadata",
+        "root_index",
+        "_db",
+        "_index_of",
+        "_containers",
+    )
+
+    def __init__(self):
+        """
+        Create an empty SubtreeView.
+        Use `from_subtree` to build one from a fetched subtree.
+        """
+        self.rids = []
+        self.names = []
+        self.types = []
+        self.descriptions = []
+        self.tags = []
+        self.metadata = []
+
+        # index of each node's parent, -1 for the subtree's root
+        self.parent_index: IntList = []
+
+        # Assets of node i are the slice [asset_offsets[i], asset_offsets[i + 1])
+        self.asset_offsets: IntList = [0]
+        self.asset_rids = []
+        self.asset_files = []
+        self.asset_names = []
+        self.asset_types = []
+        self.asset_descriptions = []
+        self.asset_tags = []
+        self.asset_metadata = []
+
+        self.root_index: int = -1
+        self._db = None
+        self._index_of: IndexMap = {}
+        self._containers = {}
+
+    @classmethod
+    def from_subtree(cls, subtree: Properties, db = None) -> 'SubtreeView':
+        """
+        Builds a SubtreeView from a fetched subtree.
+
+        Args:
+            subtree (dict[str, Any]): `GraphCommand::SubtreeWithMetadata` response.
+            db: Database connector for materialized Containers.
+
+        Returns:
+            SubtreeView: Snapshot of the subtree.
+        """
+        view = cls()
+        view._db = db
+
+        containers = subtree["containers"]
+        parents = subtree["parents"]
+        for i, container in enumerate(containers):
+            p = container["properties"]
+            view._index_of[container["rid"]] = i
+            view.rids.append(container["rid"])
+            view.names.append(p["name"])
+            view.types.append(p["kind"])
+            view.descriptions.append(p["description"])
+            view.tags.append(p["tags"])
+            view.metadata.append(p["metadata"])
+
+        for container in containers:
+            parent = parents.get(container["rid"])
+            if parent is None:
+                view.parent_index.append(-1)
+                view.root_index = len(view.parent_index) - 1
+            else:
+                view.parent_index.append(view._index_of[parent])
+
+            for asset in container["assets"].values():
+                file = asset["path"]
+                if "Absolute" not in file:
+                    raise ValueError("Asset path must be absolute")
+
+                p = asset["properties"]
+                view.asset_rids.append(asset["rid"])
+                view.asset_files.append(file["Absolute"])
+                view.asset_names.append(p["name"])
+                view.asset_types.append(p["kind"])
+                view.asset_descriptions.append(p["description"])
+                view.asset_tags.append(p["tags"])
+                view.asset_metadata.append(p["metadata"])
+
+            view.asset_offsets.append(len(view.asset_rids))
+
+        return view
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: Number of Containers in the subtree.
+        """
+        return len(self.rids)
+
+    def index_of(self, rid: str) -> int:
+        """
+        Args:
+            rid (str): Id of a Container in the subtree.
+
+        Returns:
+            int: The Container's node index.
+        """
+        return self._index_of[rid]
+
+    def container_at(self, index: int) -> Container:
+        """
+        Materializes the Container at the given node index.
+        Containers are cached, so repeated calls return the same object,
+        with parents wired up through the subtree.
+
+        Args:
+            index (int): Node index.
+
+        Returns:
+            Container: The materialized Container.
+        """
+        container = self._containers.get(index)
+        if container is not None:
+            return container
+
+        container = Container.__new__(Container)
+        container._rid = self.rids[index]
+        container._name = self.names[index]
+        container._type = self.types[index]
+        container._description = self.descriptions[index]
+        container._tags = self.tags[index]
+        container._metadata = self.metadata[index]
+        container._db = self._db
+        container._parent = None
+        container._parent_set = False
+        container._children = []
+        container._children_fetched = False
+        self._containers[index] = container
+
+        assets = []
+        for i in range(self.asset_offsets[index], self.asset_offsets[index + 1]):
+            asset = Asset.__new__(Asset)
+            asset._rid = self.asset_rids[i]
+            asset._file = self.asset_files[i]
+            asset._name = self.asset_names[i]
+            asset._type = self.asset_types[i]
+            asset._description = self.asset_descriptions[i]
+            asset._tags = self.asset_tags[i]
+            asset._metadata = self.asset_metadata[i]
+            asset._db = self._db
+            asset._parent = container
+            assets.append(asset)
+
+        container._assets = assets
+        container._assets_by_rid = {asset._rid: asset for asset in assets}
+        container._assets_fetched = True
+
+        parent = self.parent_index[index]
+        container._set_parent(self.container_at(parent) if parent >= 0 else None)
+        return container
@@ -1,5 +1,7 @@
 //! Container related commands.
 use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
+use thot_core::project::Container as CoreContainer;
 use thot_core::types::ResourceId;
 
 /// Graph related commands.
@@ -17,8 +19,25 @@ pub enum GraphCommand {
     /// Get the children of the Container.
     Children(ResourceId),
 
+    /// Get the children of the Container with inherited metadata.
+    ChildrenWithMetadata(ResourceId),
+
     /// Get the parent of the Container.
     Parent(ResourceId),
+
+    /// Gets a subtree's Containers with inherited metadata.
+    SubtreeWithMetadata(ResourceId),
+}
+
+/// Subtree of `Container`s with inherited metadata.
+#[derive(Serialize, Deserialize, Debug)]
+pub struct SubtreeWithMetadata {
+    /// All `Container`s in the subtree.
+    pub containers: Vec<CoreContainer>,
+
+    /// Map from child to parent id.
+    /// The subtree's root maps to `None`.
+    pub parents: HashMap<ResourceId, Option<ResourceId>>,
 }
 
 /// Arguments for [`Command::NewChild`].
@@ -1,10 +1,11 @@
 //! Implementation of graph related functionality.
 use super::super::Database;
-use crate::command::graph::NewChildArgs;
+use crate::command::graph::{NewChildArgs, SubtreeWithMetadata};
 use crate::command::GraphCommand;
 use crate::server::store::ContainerTree;
 use crate::{Error, Result};
 use serde_json::Value as JsValue;
+use std::collections::HashMap;
 use std::path::Path;
 use std::result::Result as StdResult;
 use thot_core::error::{Error as CoreError, ProjectError, ResourceError};
@@ -98,6 +99,60 @@ impl Database {
                 let children = graph.children(&rid).unwrap();
                 serde_json::to_value(children).expect("could not convert `Container` to JsValue")
             }
+
+            GraphCommand::ChildrenWithMetadata(rid) => {
+                let Some(graph) = self.store.get_container_graph(&rid) else {
+                    let res: Option<Vec<CoreContainer>> = None;
+                    return serde_json::to_value(res)
+                        .expect("could not convert `Container`s to JsValue");
+                };
+
+                let children = graph
+                    .children(&rid)
+                    .unwrap()
+                    .iter()
+                    .map(|child| {
+                        self.store
+                            .get_container_with_metadata(child)
+                            .expect("child `Container` not found")
+                    })
+                    .collect::<Vec<CoreContainer>>();
+
+                serde_json::to_value(children).expect("could not convert `Container`s to JsValue")
+            }
+
+            GraphCommand::SubtreeWithMetadata(root) => {
+                let Some(graph) = self.store.get_container_graph(&root) else {
+                    let res: Option<SubtreeWithMetadata> = None;
+                    return serde_json::to_value(res).expect("could not convert to JsValue");
+                };
+
+                let descendants = graph.descendants(&root).unwrap();
+                let mut containers = Vec::with_capacity(descendants.len());
+                let mut parents = HashMap::with_capacity(descendants.len());
+                for rid in descendants {
+                    let container = self
+                        .store
+                        .get_container_with_metadata(&rid)
+                        .expect("`Container` not found");
+
+                    let parent = if rid == root {
+                        None
+                    } else {
+                        graph.parent(&rid).unwrap().cloned()
+                    };
+
+                    parents.insert(rid, parent);
+                    containers.push(container);
+                }
+
+                let subtree = SubtreeWithMetadata {
+                    containers,
+                    parents,
+                };
+
+                serde_json::to_value(subtree).expect("could not convert subtree to JsValue")
+            }
         }
     }
 
@@ -4,6 +4,7 @@ use crate::{Error, Result};
 use regex::Regex;
 use std::fs;
 use std::path::{Component, Path, PathBuf, MAIN_SEPARATOR};
+use std::sync::OnceLock;
 
 /// Creates a unique file name.
 pub fn unique_file_name(path: PathBuf) -> Result<PathBuf> {
@@ -148,75 +149,117 @@ pub fn thot_dir_of(path: &Path) -> PathBuf {
 }
 
 // --- project ---
+/// Path to the project file relative to a base path.
+/// Computed once and reused across calls.
+fn project_file_path() -> &'static Path {
+    static PATH: OnceLock<PathBuf> = OnceLock::new();
+    PATH.get_or_init(|| thot_dir().join(PROJECT_FILE))
+}
+
 /// Path to the project file for a given path.
 pub fn project_file() -> PathBuf {
-    thot_dir().join(PROJECT_FILE)
+    project_file_path().to_path_buf()
 }
 
 /// Path to the project file for a given path.
 /// thot_dir(path)/\<PROJECT_FILE\>
 pub fn project_file_of(path: &Path) -> PathBuf {
-    thot_dir_of(path).join(PROJECT_FILE)
+    path.join(project_file_path())
 }
 
 // --- project settings ---
+/// Path to the project settings file relative to a base path.
+/// Computed once and reused across calls.
+fn project_settings_file_path() -> &'static Path {
+    static PATH: OnceLock<PathBuf> = OnceLock::new();
+    PATH.get_or_init(|| thot_dir().join(PROJECT_SETTINGS_FILE))
+}
+
 /// Path to the project settings file relative to a base path.
 pub fn project_settings_file() -> PathBuf {
-    thot_dir().join(PROJECT_SETTINGS_FILE)
+    project_settings_file_path().to_path_buf()
 }
 
 /// Path to the project settings file for a given path.
 /// thot_dir(path)/\<PROJECT_SETTINGS_FILE\>
 pub fn project_settings_file_of(path: &Path) -> PathBuf {
-    thot_dir_of(path).join(PROJECT_SETTINGS_FILE)
+    path.join(project_settings_file_path())
 }
 
 // --- container ---
+/// Path to the Container file relative to a base path.
+/// Computed once and reused across calls.
+fn container_file_path() -> &'static Path {
+    static PATH: OnceLock<PathBuf> = OnceLock::new();
+    PATH.get_or_init(|| thot_dir().join(CONTAINER_FILE))
+}
+
 /// Path to the Container file from a base path.
 pub fn container_file() -> PathBuf {
-    thot_dir().join(CONTAINER_FILE)
+    container_file_path().to_path_buf()
 }
 
 /// Path to the Container file for a given path.
 /// thot_dir(path)/\<CONTAINER_FILE\>
 pub fn container_file_of(path: &Path) -> PathBuf {
-    thot_dir_of(path).join(CONTAINER_FILE)
+    path.join(container_file_path())
 }
 
 // --- container settings ---
+/// Path to the Container settings file relative to a base path.
+/// Computed once and reused across calls.
+fn container_settings_file_path() -> &'static Path {
+    static PATH: OnceLock<PathBuf> = OnceLock::new();
+    PATH.get_or_init(|| thot_dir().join(CONTAINER_SETTINGS_FILE))
+}
+
 /// Path to the Container settings file from a base path.
 pub fn container_settings_file() -> PathBuf {
-    thot_dir().join(CONTAINER_SETTINGS_FILE)
+    container_settings_file_path().to_path_buf()
 }
 
 /// Path to the Container settings file for a given path.
 /// thot_dir(path)/\<CONTAINER_SETTINGS_FILE\>
 pub fn container_settings_file_of(path: &Path) -> PathBuf {
-    thot_dir_of(path).join(CONTAINER_SETTINGS_FILE)
+    path.join(container_settings_file_path())
 }
 
 // --- assets ---
+/// Path to the Assets file relative to a base path.
+/// Computed once and reused across calls.
+fn assets_file_path() -> &'static Path {
+    static PATH: OnceLock<PathBuf> = OnceLock::new();
+    PATH.get_or_init(|| thot_dir().join(ASSETS_FILE))
+}
+
 /// Path to the Assets file from a base path.
 pub fn assets_file() -> PathBuf {
-    thot_dir().join(ASSETS_FILE)
+    assets_file_path().to_path_buf()
 }
 
 /// Path to the Assets file for a given path.
 /// thot_dir(path)/\<ASSETS_FILE\>
 pub fn assets_file_of(path: &Path) -> PathBuf {
-    thot_dir_of(path).join(ASSETS_FILE)
+    path.join(assets_file_path())
 }
 
 // --- scirpts ---
+/// Path to the scripts file relative to a base path.
+/// Computed once and reused across calls.
+fn scripts_file_path() -> &'static Path {
+    static PATH: OnceLock<PathBuf> = OnceLock::new();
+    PATH.get_or_init(|| thot_dir().join(SCRIPTS_FILE))
+}
+
 /// Path to the Assets file from a base path.
 pub fn scripts_file() -> PathBuf {
-    thot_dir().join(SCRIPTS_FILE)
+    scripts_file_path().to_path_buf()
 }
 
 /// Path to the Assets file for a given path.
 /// thot_dir(path)/\<SCRIPTS_FILE\>
 pub fn scripts_file_of(path: &Path) -> PathBuf {
-    thot_dir_of(path).join(SCRIPTS_FILE)
+    path.join(scripts_file_path())
 }
 
 #[cfg(test)]